@@ -3,21 +3,73 @@ LangChain Tool Example
 
 Use crypto news as a tool in your AI agent.
 pip install langchain langchain-openai
+pip install orjson     # optional, faster JSON parsing
+pip install diskcache  # optional, caches responses across runs
+pip install brotli     # optional, smaller responses
 """
 
+import os
+import tempfile
+
 from langchain.tools import tool
 from langchain_openai import ChatOpenAI
 from langchain.agents import AgentExecutor, create_openai_functions_agent
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 import requests
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE = "https://free-crypto-news.vercel.app"
+TIMEOUT = (3.05, 10)  # (connect, read) seconds
+
+# Shared session so consecutive tool calls reuse the same connection
+session = requests.Session()
+session.headers.update({
+    "User-Agent": "free-crypto-news-langchain/1.0",
+    "Accept": "application/json",
+})
+session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
+# Responses are cached on disk (requires diskcache); errors only briefly
+CACHE_TTL = 60
+NEGATIVE_CACHE_TTL = 15
+CACHE_DIR = os.environ.get("CACHE_DIR", os.path.join(tempfile.gettempdir(), "crypto-news-langchain-cache"))
+disk_cache = Cache(CACHE_DIR, size_limit=64 << 20) if Cache else None
+
+def fetch_json(path: str) -> dict:
+    """GET an API path and parse the JSON body, using the disk cache if available."""
+    if disk_cache is not None:
+        data = disk_cache.get(path)
+        if data is not None:
+            return data
+    
+    try:
+        response = session.get(f"{API_BASE}{path}", timeout=TIMEOUT)
+        response.raise_for_status()
+        data, ttl = json_loads(response.content), CACHE_TTL
+    except (requests.RequestException, ValueError):
+        data, ttl = {}, NEGATIVE_CACHE_TTL
+    
+    if disk_cache is not None:
+        disk_cache.set(path, data, expire=ttl)
+    return data
 
 @tool
 def get_crypto_news(limit: int = 5) -> str:
     """Get the latest cryptocurrency news from 7 major sources."""
-    response = requests.get(f"{API_BASE}/api/news?limit={limit}")
-    data = response.json()
+    data = fetch_json(f"/api/news?limit={limit}")
     
     result = []
     for article in data.get("articles", []):
@@ -28,8 +80,7 @@ def get_crypto_news(limit: int = 5) -> str:
 @tool
 def search_crypto_news(keywords: str, limit: int = 5) -> str:
     """Search crypto news by keywords. Use comma-separated terms."""
-    response = requests.get(f"{API_BASE}/api/search?q={keywords}&limit={limit}")
-    data = response.json()
+    data = fetch_json(f"/api/search?q={keywords}&limit={limit}")
     
     result = []
     for article in data.get("articles", []):
@@ -40,8 +91,7 @@ def search_crypto_news(keywords: str, limit: int = 5) -> str:
 @tool
 def get_defi_news(limit: int = 5) -> str:
     """Get DeFi-specific news about yield farming, DEXs, and protocols."""
-    response = requests.get(f"{API_BASE}/api/defi?limit={limit}")
-    data = response.json()
+    data = fetch_json(f"/api/defi?limit={limit}")
     
     result = []
     for article in data.get("articles", []):
@@ -52,8 +102,7 @@ def get_defi_news(limit: int = 5) -> str:
 @tool  
 def get_bitcoin_news(limit: int = 5) -> str:
     """Get Bitcoin-specific news about BTC, mining, Lightning Network."""
-    response = requests.get(f"{API_BASE}/api/bitcoin?limit={limit}")
-    data = response.json()
+    data = fetch_json(f"/api/bitcoin?limit={limit}")
     
     result = []
     for article in data.get("articles", []):
@@ -64,8 +113,7 @@ def get_bitcoin_news(limit: int = 5) -> str:
 @tool
 def get_breaking_news(limit: int = 5) -> str:
     """Get breaking crypto news from the last 2 hours."""
-    response = requests.get(f"{API_BASE}/api/breaking?limit={limit}")
-    data = response.json()
+    data = fetch_json(f"/api/breaking?limit={limit}")
     
     result = []
     for article in data.get("articles", []):
@@ -2,21 +2,50 @@
 Telegram Bot Example
 
 Simple bot that responds to /news commands.
-pip install python-telegram-bot
+pip install python-telegram-bot "httpx[http2]"
+pip install orjson  # optional, faster JSON parsing
+pip install uvloop  # optional, faster event loop
+pip install brotli  # optional, smaller responses
 """
 
 import asyncio
-import aiohttp
+import httpx
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 
 API_BASE = "https://free-crypto-news.vercel.app"
 BOT_TOKEN = "YOUR_BOT_TOKEN"  # Get from @BotFather
+# httpx already negotiates compression (br too, once brotli is installed)
+REQUEST_HEADERS = {"Accept": "application/json"}
+
+# One HTTP/2 client for the whole bot so connections to the API are kept alive
+http_client = None
+
+async def on_startup(app):
+    global http_client
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60),
+        timeout=10.0,
+        headers=REQUEST_HEADERS,
+    )
+    app.bot_data["http"] = http_client
+
+async def on_shutdown(app):
+    if http_client:
+        await http_client.aclose()
 
 async def fetch_news(endpoint="/api/news", limit=5):
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{API_BASE}{endpoint}?limit={limit}") as resp:
-            return await resp.json()
+    resp = await http_client.get(f"{API_BASE}{endpoint}?limit={limit}")
+    return json_loads(resp.content)
 
 async def news_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /news command"""
@@ -75,7 +104,16 @@ async def breaking_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(message, parse_mode="Markdown")
 
 def main():
-    app = Application.builder().token(BOT_TOKEN).build()
+    if uvloop:
+        uvloop.install()
+    
+    app = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .post_init(on_startup)
+        .post_shutdown(on_shutdown)
+        .build()
+    )
     
     app.add_handler(CommandHandler("news", news_command))
     app.add_handler(CommandHandler("defi", defi_command))
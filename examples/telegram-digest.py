@@ -21,17 +21,37 @@ Setup:
 4. Run: python telegram-digest.py
 
 Requirements:
-pip install python-telegram-bot aiohttp
+pip install python-telegram-bot "httpx[http2]"
+pip install orjson     # optional, faster JSON parsing
+pip install diskcache  # optional, keeps the API cache across restarts
+pip install uvloop     # optional, faster event loop
+pip install brotli     # optional, smaller responses
 """
 
 import os
 import json
+import tempfile
 import asyncio
 import logging
-from datetime import datetime, time
+import sqlite3
+from datetime import datetime, time, timezone
+from time import monotonic, time as unix_time
 from typing import Optional
-import aiohttp
+import httpx
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import RetryAfter
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -43,9 +63,47 @@ from telegram.ext import (
 # Configuration
 BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN', 'YOUR_BOT_TOKEN_HERE')
 API_BASE = 'https://free-crypto-news.vercel.app'
+# httpx already negotiates compression (br too, once brotli is installed)
+REQUEST_HEADERS = {'Accept': 'application/json'}
+
+# Subscribed users are kept in SQLite so they survive restarts
+SUBSCRIBERS_DB = os.environ.get('SUBSCRIBERS_DB', 'subscribers.db')
+db = sqlite3.connect(SUBSCRIBERS_DB, check_same_thread=False)
+db.execute(
+    'CREATE TABLE IF NOT EXISTS subscribers ('
+    'user_id INTEGER PRIMARY KEY, chat_id INTEGER NOT NULL, '
+    'timezone TEXT NOT NULL, subscribed_at TEXT NOT NULL)'
+)
 
-# Storage for subscribed users (use database in production)
-subscribed_users: dict[int, dict] = {}
+# Shared HTTP/2 client (created on startup, reused by every request)
+http_client: Optional[httpx.AsyncClient] = None
+
+# How long (seconds) API responses are cached per endpoint
+CACHE_TTL = {
+    'news': 60,
+    'bitcoin': 60,
+    'defi': 60,
+    'breaking': 30,
+    'trending': 300,
+    'analyze': 300,
+}
+DEFAULT_CACHE_TTL = 60
+# Failed fetches are remembered briefly so outages don't hammer the API
+NEGATIVE_CACHE_TTL = 15
+
+# On-disk copy of the cache, survives restarts (requires diskcache)
+CACHE_DIR = os.environ.get('CACHE_DIR', os.path.join(tempfile.gettempdir(), 'crypto-news-cache'))
+disk_cache = Cache(CACHE_DIR, size_limit=64 << 20) if Cache else None
+
+# Max digest messages in flight at once (Telegram allows ~30 messages/sec)
+DIGEST_SEND_CONCURRENCY = 25
+# Attempts per subscriber when Telegram asks us to slow down
+DIGEST_SEND_ATTEMPTS = 3
+
+# (endpoint, limit) -> (expires_at, data, etag); data is None for failed fetches
+_cache: dict[tuple[str, int], tuple[float, Optional[dict], Optional[str]]] = {}
+# (endpoint, limit) -> fetch in progress, awaited by every concurrent caller
+_inflight: dict[tuple[str, int], asyncio.Task] = {}
 
 # Logging
 logging.basicConfig(
@@ -55,59 +113,118 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def on_startup(application: Application) -> None:
+    """Open the shared HTTP client."""
+    global http_client
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60),
+        timeout=10.0,
+        headers=REQUEST_HEADERS,
+    )
+    application.bot_data['http'] = http_client
+
+
+async def on_shutdown(application: Application) -> None:
+    """Close the shared HTTP client."""
+    if http_client:
+        await http_client.aclose()
+
+
+async def invalidate(endpoint: str) -> None:
+    """Drop cached responses for an endpoint."""
+    for key in [key for key in _cache if key[0] == endpoint]:
+        del _cache[key]
+    if disk_cache is not None:
+        await asyncio.to_thread(_invalidate_disk, endpoint)
+
+
+def _invalidate_disk(endpoint: str) -> None:
+    """Drop an endpoint's entries from the on-disk cache (blocking)."""
+    for key in [key for key in disk_cache if key[0] == endpoint]:
+        disk_cache.delete(key)
+
+
 async def fetch_news(endpoint: str, limit: int = 5) -> Optional[dict]:
-    """Fetch news from API."""
+    """Fetch news from API, serving repeat requests from a short-lived cache."""
+    key = (endpoint, limit)
+    
+    cached = _cache.get(key)
+    if cached and monotonic() < cached[0]:
+        return cached[1]
+    
+    # Only one request per key goes upstream; the rest await its result
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_load(endpoint, limit))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so a cancelled caller doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+async def _load(endpoint: str, limit: int) -> Optional[dict]:
+    """Refill the cache for (endpoint, limit) from disk or the API."""
+    key = (endpoint, limit)
+    
+    # diskcache does blocking SQLite/file I/O, so keep it off the event loop
+    if disk_cache is not None:
+        stored, expire_time = await asyncio.to_thread(disk_cache.get, key, expire_time=True)
+        if stored is not None:
+            data, etag = stored
+            _cache[key] = (monotonic() + expire_time - unix_time(), data, etag)
+            return data
+    
+    data, etag = await _fetch_upstream(endpoint, limit, _cache.get(key))
+    ttl = CACHE_TTL.get(endpoint, DEFAULT_CACHE_TTL) if data is not None else NEGATIVE_CACHE_TTL
+    _cache[key] = (monotonic() + ttl, data, etag)
+    if disk_cache is not None:
+        await asyncio.to_thread(disk_cache.set, key, (data, etag), expire=ttl)
+    return data
+
+
+async def _fetch_upstream(endpoint: str, limit: int, cached: Optional[tuple]) -> tuple[Optional[dict], Optional[str]]:
+    """Request an endpoint, revalidating a stale cache entry via its ETag."""
+    headers = {}
+    if cached and cached[1] is not None and cached[2]:
+        headers['If-None-Match'] = cached[2]
+    
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f'{API_BASE}/api/{endpoint}?limit={limit}') as resp:
-                if resp.status == 200:
-                    return await resp.json()
+        resp = await http_client.get(f'{API_BASE}/api/{endpoint}?limit={limit}', headers=headers)
+        if resp.status_code == 304 and headers:
+            return cached[1], cached[2]
+        if resp.status_code == 200:
+            return json_loads(resp.content), resp.headers.get('ETag')
+        logger.error(f"API fetch error: {endpoint} returned HTTP {resp.status_code}")
     except Exception as e:
         logger.error(f"API fetch error: {e}")
-    return None
+    return None, None
 
 
 def format_article(article: dict, index: int = None) -> str:
     """Format a single article for Telegram."""
-    prefix = f"{index}. " if index else "📰 "
-    source = article.get('source', 'Unknown')
-    title = article.get('title', 'No title')
-    link = article.get('link', '')
-    time_ago = article.get('timeAgo', '')
+    prefix = f"{index}\\. " if index else "📰 "
+    title = escape_markdown(article.get('title', 'No title'))
+    source = escape_markdown(article.get('source', 'Unknown'))
+    time_ago = escape_markdown(article.get('timeAgo', ''))
+    link = article.get('link', '').translate(LINK_ESCAPES)
     
-    return f"{prefix}*{escape_markdown(title)}*\n└ {source} • {time_ago}\n🔗 [Read more]({link})"
+    return f"{prefix}*{title}*\n└ {source} • {time_ago}\n🔗 [Read more]({link})"
+
+
+# MarkdownV2 special characters, escaped in a single pass
+MARKDOWN_ESCAPES = str.maketrans({char: f'\\{char}' for char in '_*[]()~`>#+-=|{}.!'})
+# Inside a MarkdownV2 link URL only ')' and backslashes need escaping
+LINK_ESCAPES = str.maketrans({char: f'\\{char}' for char in ')\\'})
 
 
 def escape_markdown(text: str) -> str:
     """Escape markdown special characters."""
-    special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-    for char in special_chars:
-        text = text.replace(char, f'\\{char}')
-    return text
+    return text.translate(MARKDOWN_ESCAPES)
 
 
-async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Send welcome message."""
-    keyboard = [
-        [
-            InlineKeyboardButton("📰 Latest News", callback_data='news'),
-            InlineKeyboardButton("🔥 Breaking", callback_data='breaking'),
-        ],
-        [
-            InlineKeyboardButton("₿ Bitcoin", callback_data='bitcoin'),
-            InlineKeyboardButton("🏦 DeFi", callback_data='defi'),
-        ],
-        [
-            InlineKeyboardButton("📊 Trending", callback_data='trending'),
-            InlineKeyboardButton("📋 Full Digest", callback_data='digest'),
-        ],
-        [
-            InlineKeyboardButton("🔔 Subscribe Daily", callback_data='subscribe'),
-        ],
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
-    welcome_text = """
+# Static replies, built once at import
+WELCOME_TEXT = """
 🚀 *Welcome to Crypto News Bot\\!*
 
 Get real\\-time crypto news from 7 major sources:
@@ -126,36 +243,64 @@ Get real\\-time crypto news from 7 major sources:
 /unsubscribe \\- Stop daily digest
 
 Choose an option below or type a command:
-    """
-    
+"""
+
+MAIN_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📰 Latest News", callback_data='news'),
+        InlineKeyboardButton("🔥 Breaking", callback_data='breaking'),
+    ],
+    [
+        InlineKeyboardButton("₿ Bitcoin", callback_data='bitcoin'),
+        InlineKeyboardButton("🏦 DeFi", callback_data='defi'),
+    ],
+    [
+        InlineKeyboardButton("📊 Trending", callback_data='trending'),
+        InlineKeyboardButton("📋 Full Digest", callback_data='digest'),
+    ],
+    [
+        InlineKeyboardButton("🔔 Subscribe Daily", callback_data='subscribe'),
+    ],
+])
+
+NEWS_TITLES = {
+    'news': escape_markdown('📰 Latest Crypto News'),
+    'bitcoin': escape_markdown('₿ Bitcoin News'),
+    'defi': escape_markdown('🏦 DeFi News'),
+    'breaking': escape_markdown('🔥 Breaking News'),
+}
+
+
+async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Send welcome message."""
     await update.message.reply_text(
-        welcome_text,
-        reply_markup=reply_markup,
+        WELCOME_TEXT,
+        reply_markup=MAIN_KEYBOARD,
         parse_mode='MarkdownV2'
     )
 
 
 async def news_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Get latest news."""
-    await send_news(update, 'news', '📰 Latest Crypto News', 5)
+    await send_news(update, 'news', 5)
 
 
 async def bitcoin_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Get Bitcoin news."""
-    await send_news(update, 'bitcoin', '₿ Bitcoin News', 5)
+    await send_news(update, 'bitcoin', 5)
 
 
 async def defi_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Get DeFi news."""
-    await send_news(update, 'defi', '🏦 DeFi News', 5)
+    await send_news(update, 'defi', 5)
 
 
 async def breaking_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Get breaking news."""
-    await send_news(update, 'breaking', '🔥 Breaking News', 5)
+    await send_news(update, 'breaking', 5)
 
 
-async def send_news(update: Update, endpoint: str, title: str, limit: int) -> None:
+async def send_news(update: Update, endpoint: str, limit: int) -> None:
     """Generic news sender."""
     message = update.message or update.callback_query.message
     
@@ -170,11 +315,13 @@ async def send_news(update: Update, endpoint: str, title: str, limit: int) -> No
     
     articles = data['articles'][:limit]
     
-    text = f"*{escape_markdown(title)}*\n\n"
+    parts = [f"*{NEWS_TITLES[endpoint]}*\n\n"]
     for i, article in enumerate(articles, 1):
-        text += format_article(article, i) + "\n\n"
+        parts.append(format_article(article, i))
+        parts.append("\n\n")
     
-    text += f"_Updated: {datetime.now().strftime('%H:%M UTC')}_"
+    parts.append(f"_Updated: {datetime.now(timezone.utc):%H:%M} UTC_")
+    text = "".join(parts)
     
     await loading_msg.edit_text(text, parse_mode='MarkdownV2', disable_web_page_preview=True)
 
@@ -190,7 +337,7 @@ async def trending_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         await loading_msg.edit_text("❌ Failed to fetch trends.")
         return
     
-    text = "*📊 Trending Crypto Topics \\(24h\\)*\n\n"
+    parts = ["*📊 Trending Crypto Topics \\(24h\\)*\n\n"]
     
     for i, topic in enumerate(data['trending'][:10], 1):
         sentiment_emoji = '🟢' if topic.get('sentiment') == 'bullish' else '🔴' if topic.get('sentiment') == 'bearish' else '⚪'
@@ -198,9 +345,10 @@ async def trending_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         count = topic.get('count', 0)
         sentiment = topic.get('sentiment', 'neutral')
         
-        text += f"{i}\\. {sentiment_emoji} *{topic_name}* \\- {count} mentions \\({sentiment}\\)\n"
+        parts.append(f"{i}\\. {sentiment_emoji} *{topic_name}* \\- {count} mentions \\({sentiment}\\)\n")
     
-    text += f"\n_Analyzed {data.get('articlesAnalyzed', 0)} articles_"
+    parts.append(f"\n_Analyzed {data.get('articlesAnalyzed', 0)} articles_")
+    text = "".join(parts)
     
     await loading_msg.edit_text(text, parse_mode='MarkdownV2')
 
@@ -210,13 +358,18 @@ async def digest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     message = update.message or update.callback_query.message
     loading_msg = await message.reply_text("⏳ Generating digest... This may take a moment.")
     
-    # Fetch multiple endpoints
-    news_data = await fetch_news('news', 5)
-    trending_data = await fetch_news('trending', 5)
-    analyze_data = await fetch_news('analyze', 10)
+    # Fetch multiple endpoints concurrently
+    news_data, trending_data, analyze_data = await asyncio.gather(
+        fetch_news('news', 5),
+        fetch_news('trending', 5),
+        fetch_news('analyze', 10),
+    )
     
-    text = "📋 *CRYPTO NEWS DIGEST*\n"
-    text += f"_{escape_markdown(datetime.now().strftime('%B %d, %Y'))}_\n\n"
+    parts = [
+        "📋 *CRYPTO NEWS DIGEST*\n",
+        # Month names, digits and commas need no MarkdownV2 escaping
+        f"_{datetime.now(timezone.utc):%B %d, %Y}_\n\n",
+    ]
     
     # Market Sentiment
     if analyze_data and analyze_data.get('analysis'):
@@ -225,24 +378,26 @@ async def digest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         breakdown = analysis.get('sentimentBreakdown', {})
         
         sentiment_emoji = '🟢' if sentiment == 'bullish' else '🔴' if sentiment == 'bearish' else '⚪'
-        text += f"*Market Sentiment:* {sentiment_emoji} {escape_markdown(sentiment.upper())}\n"
-        text += f"Bullish: {breakdown.get('bullish', 0)} \\| Bearish: {breakdown.get('bearish', 0)} \\| Neutral: {breakdown.get('neutral', 0)}\n\n"
+        parts.append(f"*Market Sentiment:* {sentiment_emoji} {escape_markdown(sentiment.upper())}\n")
+        parts.append(f"Bullish: {breakdown.get('bullish', 0)} \\| Bearish: {breakdown.get('bearish', 0)} \\| Neutral: {breakdown.get('neutral', 0)}\n\n")
     
     # Trending Topics
     if trending_data and trending_data.get('trending'):
-        text += "*🔥 Top Trending:*\n"
+        parts.append("*🔥 Top Trending:*\n")
         for topic in trending_data['trending'][:5]:
             emoji = '🟢' if topic.get('sentiment') == 'bullish' else '🔴' if topic.get('sentiment') == 'bearish' else '⚪'
-            text += f"  {emoji} {escape_markdown(topic.get('topic', ''))} \\({topic.get('count', 0)}\\)\n"
-        text += "\n"
+            parts.append(f"  {emoji} {escape_markdown(topic.get('topic', ''))} \\({topic.get('count', 0)}\\)\n")
+        parts.append("\n")
     
     # Top Headlines
     if news_data and news_data.get('articles'):
-        text += "*📰 Top Headlines:*\n\n"
+        parts.append("*📰 Top Headlines:*\n\n")
         for i, article in enumerate(news_data['articles'][:5], 1):
-            text += format_article(article, i) + "\n\n"
+            parts.append(format_article(article, i))
+            parts.append("\n\n")
     
-    text += "_Powered by Free Crypto News API_"
+    parts.append("_Powered by Free Crypto News API_")
+    text = "".join(parts)
     
     await loading_msg.edit_text(text, parse_mode='MarkdownV2', disable_web_page_preview=True)
 
@@ -252,7 +407,13 @@ async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     user_id = update.effective_user.id
     chat_id = update.effective_chat.id
     
-    if user_id in subscribed_users:
+    with db:
+        added = db.execute(
+            'INSERT OR IGNORE INTO subscribers VALUES (?, ?, ?, ?)',
+            (user_id, chat_id, 'UTC', datetime.now(timezone.utc).isoformat())
+        ).rowcount
+    
+    if not added:
         await update.message.reply_text(
             "✅ You're already subscribed to daily digests\\!\n"
             "Use /unsubscribe to stop receiving them\\.",
@@ -260,12 +421,6 @@ async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         )
         return
     
-    subscribed_users[user_id] = {
-        'chat_id': chat_id,
-        'subscribed_at': datetime.now().isoformat(),
-        'timezone': 'UTC'
-    }
-    
     await update.message.reply_text(
         "🔔 *Subscribed to Daily Digest\\!*\n\n"
         "You'll receive a news digest every day at 9:00 AM UTC\\.\n"
@@ -278,8 +433,10 @@ async def unsubscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE
     """Unsubscribe from daily digests."""
     user_id = update.effective_user.id
     
-    if user_id in subscribed_users:
-        del subscribed_users[user_id]
+    with db:
+        removed = db.execute('DELETE FROM subscribers WHERE user_id = ?', (user_id,)).rowcount
+    
+    if removed:
         await update.message.reply_text("🔕 Unsubscribed from daily digests\\.", parse_mode='MarkdownV2')
     else:
         await update.message.reply_text("You're not subscribed to daily digests\\.", parse_mode='MarkdownV2')
@@ -292,14 +449,9 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     
     action = query.data
     
-    if action == 'news':
-        await send_news(update, 'news', '📰 Latest Crypto News', 5)
-    elif action == 'bitcoin':
-        await send_news(update, 'bitcoin', '₿ Bitcoin News', 5)
-    elif action == 'defi':
-        await send_news(update, 'defi', '🏦 DeFi News', 5)
-    elif action == 'breaking':
-        await send_news(update, 'breaking', '🔥 Breaking News', 5)
+    # News buttons share their callback data with the endpoint name
+    if action in NEWS_TITLES:
+        await send_news(update, action, 5)
     elif action == 'trending':
         await trending_command(update, context)
     elif action == 'digest':
@@ -310,43 +462,72 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await subscribe_command(update, context)
 
 
+async def build_daily_digest() -> str:
+    """Render the daily digest message (the same for every subscriber)."""
+    news_data, trending_data = await asyncio.gather(
+        fetch_news('news', 5),
+        fetch_news('trending', 5),
+    )
+    
+    parts = ["🌅 *GOOD MORNING\\! Your Daily Crypto Digest*\n\n"]
+    
+    if trending_data and trending_data.get('trending'):
+        parts.append("*🔥 Today's Hot Topics:*\n")
+        for topic in trending_data['trending'][:5]:
+            emoji = '🟢' if topic.get('sentiment') == 'bullish' else '🔴' if topic.get('sentiment') == 'bearish' else '⚪'
+            parts.append(f"  {emoji} {escape_markdown(topic.get('topic', ''))}\n")
+        parts.append("\n")
+    
+    if news_data and news_data.get('articles'):
+        parts.append("*📰 Headlines:*\n\n")
+        for i, article in enumerate(news_data['articles'][:5], 1):
+            parts.append(format_article(article, i))
+            parts.append("\n\n")
+    
+    parts.append("_Have a great day\\! 🚀_")
+    return "".join(parts)
+
+
+async def prebuild_daily_digest(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Render the digest ahead of time so delivery is just sending."""
+    context.bot_data['digest_text'] = await build_daily_digest()
+
+
 async def send_daily_digest(context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send daily digest to all subscribers."""
-    logger.info(f"Sending daily digest to {len(subscribed_users)} subscribers")
-    
-    for user_id, user_data in subscribed_users.items():
-        try:
-            chat_id = user_data['chat_id']
-            
-            # Fetch digest data
-            news_data = await fetch_news('news', 5)
-            trending_data = await fetch_news('trending', 5)
-            
-            text = "🌅 *GOOD MORNING\\! Your Daily Crypto Digest*\n\n"
-            
-            if trending_data and trending_data.get('trending'):
-                text += "*🔥 Today's Hot Topics:*\n"
-                for topic in trending_data['trending'][:5]:
-                    emoji = '🟢' if topic.get('sentiment') == 'bullish' else '🔴' if topic.get('sentiment') == 'bearish' else '⚪'
-                    text += f"  {emoji} {escape_markdown(topic.get('topic', ''))}\n"
-                text += "\n"
-            
-            if news_data and news_data.get('articles'):
-                text += "*📰 Headlines:*\n\n"
-                for i, article in enumerate(news_data['articles'][:5], 1):
-                    text += format_article(article, i) + "\n\n"
-            
-            text += "_Have a great day\\! 🚀_"
-            
-            await context.bot.send_message(
-                chat_id=chat_id,
-                text=text,
-                parse_mode='MarkdownV2',
-                disable_web_page_preview=True
-            )
-            
-        except Exception as e:
-            logger.error(f"Failed to send digest to {user_id}: {e}")
+    subscribers = db.execute('SELECT user_id, chat_id FROM subscribers').fetchall()
+    logger.info(f"Sending daily digest to {len(subscribers)} subscribers")
+    
+    # Popped so a missed prebuild never resends yesterday's digest
+    text = context.bot_data.pop('digest_text', None) or await build_daily_digest()
+    
+    semaphore = asyncio.Semaphore(DIGEST_SEND_CONCURRENCY)
+    
+    async def send_to(user_id: int, chat_id: int) -> None:
+        for attempt in range(1, DIGEST_SEND_ATTEMPTS + 1):
+            try:
+                async with semaphore:
+                    await context.bot.send_message(
+                        chat_id=chat_id,
+                        text=text,
+                        parse_mode='MarkdownV2',
+                        disable_web_page_preview=True
+                    )
+                return
+            except RetryAfter as e:
+                if attempt == DIGEST_SEND_ATTEMPTS:
+                    logger.error(f"Failed to send digest to {user_id}: {e}")
+                    return
+                # Flood limit hit; wait outside the semaphore as Telegram asks
+                await asyncio.sleep(e.retry_after)
+            except Exception as e:
+                logger.error(f"Failed to send digest to {user_id}: {e}")
+                return
+    
+    await asyncio.gather(*(
+        send_to(user_id, chat_id)
+        for user_id, chat_id in subscribers
+    ))
 
 
 def main() -> None:
@@ -356,8 +537,17 @@ def main() -> None:
         print("   Get a token from @BotFather on Telegram")
         return
     
+    if uvloop:
+        uvloop.install()
+    
     # Create application
-    application = Application.builder().token(BOT_TOKEN).build()
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .post_init(on_startup)
+        .post_shutdown(on_shutdown)
+        .build()
+    )
     
     # Add handlers
     application.add_handler(CommandHandler("start", start))
@@ -372,9 +562,14 @@ def main() -> None:
     application.add_handler(CommandHandler("unsubscribe", unsubscribe_command))
     application.add_handler(CallbackQueryHandler(button_callback))
     
-    # Schedule daily digest at 9:00 AM UTC
+    # Schedule daily digest at 9:00 AM UTC, rendered a few minutes earlier
     job_queue = application.job_queue
     if job_queue:
+        job_queue.run_daily(
+            prebuild_daily_digest,
+            time=time(hour=8, minute=55),
+            name='prebuild_daily_digest'
+        )
         job_queue.run_daily(
             send_daily_digest,
             time=time(hour=9, minute=0),